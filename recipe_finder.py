@@ -1,14 +1,44 @@
+import atexit
+import functools
 import json
+import os
+import threading
+import webbrowser
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Tuple, Any, Iterator, Optional
+from dataclasses import dataclass, asdict
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
 
 # Configuration
-API_KEY = "Insert_Yours"
+API_KEY_ENV_VAR = "SPOONACULAR_API_KEY"
 BASE_URL = "https://api.spoonacular.com"
+REQUEST_TIMEOUT = (3.05, 10)
+HTTP_CACHE_EXPIRE_SECONDS = 3600
+SAVE_DELAY_MS = 500
 
 WINDOW_SIZE = "800x600"
 PADDING = 20
@@ -19,20 +49,44 @@ BACKGROUND_COLOR = "#F5F5F5"
 TEXT_COLOR = "#212121"
 ERROR_COLOR = "#F44336"
 
-TITLE_FONT = (FONT_FAMILY, 24, "bold")
-HEADER_FONT = (FONT_FAMILY, 16, "bold")
-NORMAL_FONT = (FONT_FAMILY, 12)
-SMALL_FONT = (FONT_FAMILY, 10)
-
-@dataclass
+@functools.lru_cache(maxsize=None)
+def fonts() -> Dict[str, Tuple]:
+    # Only built once a widget needs them, so the services can be used headless
+    return {
+        "title": (FONT_FAMILY, 24, "bold"),
+        "header": (FONT_FAMILY, 16, "bold"),
+        "normal": (FONT_FAMILY, 12),
+        "small": (FONT_FAMILY, 10),
+        "small_bold": (FONT_FAMILY, 10, "bold"),
+        "star": (FONT_FAMILY, 16)
+    }
+
+CARD_HEIGHT = 240
+ROW_HEIGHT = CARD_HEIGHT + PADDING
+VISIBLE_ROW_MARGIN = 2
+SCROLL_IDLE_MS = 150
+RESULTS_SCROLL_TAG = "RecipeResults"
+
+_NORM_TABLE = str.maketrans({";": ",", "\n": ",", "\t": ","})
+
+def normalize_ingredients(ingredients: str) -> str:
+    # "chicken; Rice " and "chicken,rice" become the same query (and cache key)
+    tokens = (token.strip().lower() for token in ingredients.translate(_NORM_TABLE).split(","))
+    return ",".join(token for token in tokens if token)
+
+@dataclass(frozen=True)
 class Recipe:
+    # Declared by hand rather than slots=True, which needs Python 3.10
+    __slots__ = ("id", "title", "used_ingredients", "missed_ingredients")
+
     id: int
     title: str
-    used_ingredients: List[str]
-    missed_ingredients: List[str]
+    used_ingredients: Tuple[str, ...]
+    missed_ingredients: Tuple[str, ...]
     
     @property
     def spoonacular_url(self) -> str:
+        # Built on demand: only the View Online button reads it
         formatted_title = self.title.replace(' ', '-').lower()
         return f"https://spoonacular.com/recipes/{formatted_title}-{self.id}"
     
@@ -41,16 +95,64 @@ class Recipe:
         return cls(
             id=data.get('id', 0),
             title=data.get('title', 'No Title'),
-            used_ingredients=[i['name'] for i in data.get('usedIngredients', [])],
-            missed_ingredients=[i['name'] for i in data.get('missedIngredients', [])]
+            used_ingredients=tuple(i['name'] for i in data.get('usedIngredients', [])),
+            missed_ingredients=tuple(i['name'] for i in data.get('missedIngredients', []))
         )
 
 class RecipeService:
-    def __init__(self):
+    def __init__(self, api_key: Optional[str] = None):
         self.base_url = BASE_URL
-        self.api_key = API_KEY
+        self.api_key = api_key or os.environ.get(API_KEY_ENV_VAR)
+        if not self.api_key:
+            raise RuntimeError(
+                f"No Spoonacular API key found. Set the {API_KEY_ENV_VAR} environment variable."
+            )
+        self.session = self._create_session(cached=True)
+        # requests-cache reads the whole body before returning, which would defeat ijson streaming
+        self._search_session = self.session if ijson is None else self._create_session(cached=False)
+        # Recipe content doesn't change per id, so repeat lookups skip the network
+        self._search_cache: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+        self._details_cache: Dict[int, Dict[str, Any]] = {}
+        self._instructions_cache: Dict[int, List[Dict[str, Any]]] = {}
+
+    def close(self):
+        self.session.close()
+        self._search_session.close()
+
+    @staticmethod
+    def _create_session(cached: bool) -> requests.Session:
+        if cached and CachedSession is not None:
+            # Repeat lookups within the hour never hit the network. apiKey is left out of
+            # cache keys so the key is never written to the cache file.
+            session = CachedSession(
+                cache_name=str(Path.home() / ".recipe_finder_http_cache"),
+                backend="sqlite",
+                expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                allowable_methods=("GET",),
+                ignored_parameters=["apiKey"]
+            )
+        else:
+            session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+        session.headers.update({
+            "User-Agent": "RecipeFinder/1.0",
+            "Accept": "application/json"
+        })
+        return session
+
+    def find_recipes_by_ingredients(self, ingredients: str, limit: int = 5) -> Iterator[Dict[str, Any]]:
+        key = (ingredients, limit)
+        if key in self._search_cache:
+            yield from self._search_cache[key]
+            return
 
-    def find_recipes_by_ingredients(self, ingredients: str, limit: int = 5) -> List[Dict[str, Any]]:
+        results = []
+        for data in self._stream_recipes(ingredients, limit):
+            results.append(data)
+            yield data
+        self._search_cache[key] = results
+
+    def _stream_recipes(self, ingredients: str, limit: int) -> Iterator[Dict[str, Any]]:
         url = f"{self.base_url}/recipes/findByIngredients"
         params = {
             "ingredients": ingredients,
@@ -59,52 +161,100 @@ class RecipeService:
             "ignorePantry": True,
             "apiKey": self.api_key
         }
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        with self._search_session.get(url, params=params, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            if ijson is None:
+                yield from json_loads(response.content)
+                return
+            # Yield each recipe as soon as it has been parsed off the wire
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "item")
 
     def get_recipe_details(self, recipe_id: int) -> Dict[str, Any]:
-        url = f"{self.base_url}/recipes/{recipe_id}/information"
-        params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        if recipe_id not in self._details_cache:
+            self._cache_details(self._get(f"/recipes/{recipe_id}/information"))
+        return self._details_cache[recipe_id]
 
     def get_recipe_instructions(self, recipe_id: int) -> List[Dict[str, Any]]:
-        url = f"{self.base_url}/recipes/{recipe_id}/analyzedInstructions"
-        params = {"apiKey": self.api_key}
-        response = requests.get(url, params=params)
+        if recipe_id not in self._instructions_cache:
+            self._instructions_cache[recipe_id] = self._get(f"/recipes/{recipe_id}/analyzedInstructions")
+        return self._instructions_cache[recipe_id]
+
+    def get_recipe_details_bulk(self, recipe_ids: List[int]) -> List[Dict[str, Any]]:
+        missing = [recipe_id for recipe_id in recipe_ids if recipe_id not in self._details_cache]
+        if missing:
+            results = self._get(
+                "/recipes/informationBulk",
+                ids=",".join(map(str, missing)),
+                includeNutrition=False
+            )
+            for details in results:
+                self._cache_details(details)
+        return [self._details_cache[recipe_id] for recipe_id in recipe_ids if recipe_id in self._details_cache]
+
+    def _cache_details(self, details: Dict[str, Any]):
+        self._details_cache[details["id"]] = details
+        # Details embed the same steps the analyzedInstructions endpoint returns; when the
+        # field is absent, leave get_recipe_instructions to fetch them
+        if "analyzedInstructions" in details:
+            self._instructions_cache.setdefault(details["id"], details["analyzedInstructions"])
+
+    def _get(self, path: str, **params) -> Any:
+        url = f"{self.base_url}{path}"
+        params["apiKey"] = self.api_key
+        response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
 
 class FavoritesService:
-    def __init__(self):
+    def __init__(self, root=None):
+        self.root = root
         self.favorites_file = Path.home() / ".recipe_finder_favorites.json"
         self.favorites = self._load_favorites()
+        self._favorite_ids = {int(recipe_id) for recipe_id in self.favorites}
+        self._dirty = False
+        self._save_job = None
+        atexit.register(self._flush)
 
     def _load_favorites(self):
         if self.favorites_file.exists():
             try:
-                with open(self.favorites_file, 'r') as f:
-                    return json.load(f)
+                return json_loads(self.favorites_file.read_bytes())
             except json.JSONDecodeError:
                 return {}
         return {}
 
     def _save_favorites(self):
-        with open(self.favorites_file, 'w') as f:
-            json.dump(self.favorites, f)
+        # Coalesce bursts of favorite toggles into a single write
+        self._dirty = True
+        if self.root is None:
+            self._flush()
+            return
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(SAVE_DELAY_MS, self._flush)
+
+    def _flush(self):
+        self._save_job = None
+        if not self._dirty:
+            return
+        tmp_file = self.favorites_file.with_suffix(".tmp")
+        tmp_file.write_bytes(json_dumps(self.favorites))
+        os.replace(tmp_file, self.favorites_file)
+        self._dirty = False
 
     def add_favorite(self, recipe_id, recipe_data):
         self.favorites[str(recipe_id)] = recipe_data
+        self._favorite_ids.add(recipe_id)
         self._save_favorites()
 
     def remove_favorite(self, recipe_id):
         self.favorites.pop(str(recipe_id), None)
+        self._favorite_ids.discard(recipe_id)
         self._save_favorites()
 
     def is_favorite(self, recipe_id):
-        return str(recipe_id) in self.favorites
+        return recipe_id in self._favorite_ids
 
 class RecipeDetailWindow(tk.Toplevel):
     def __init__(self, parent, recipe_data, recipe_service):
@@ -123,201 +273,233 @@ class RecipeDetailWindow(tk.Toplevel):
         container = ttk.Frame(self)
         container.pack(fill=tk.BOTH, expand=True, padx=PADDING, pady=PADDING)
 
-        canvas = tk.Canvas(container, bg=BACKGROUND_COLOR)
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = ttk.Frame(canvas)
-
-        canvas.configure(yscrollcommand=scrollbar.set)
-        ttk.Label(
-            self.scrollable_frame,
-            text=self.recipe_data["title"],
-            font=TITLE_FONT,
-            wraplength=550
-        ).pack(pady=(0, PADDING))
-
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # The whole page is one read-only Text widget, styled with tags
+        self.text = tk.Text(
+            container,
+            wrap="word",
+            font=fonts()["normal"],
+            bd=0,
+            bg=BACKGROUND_COLOR,
+            fg=TEXT_COLOR,
+            highlightthickness=0,
+            cursor="arrow"
         )
+        scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.text.yview)
+        self.text.configure(yscrollcommand=scrollbar.set)
+
+        self.text.tag_configure("title", font=fonts()["title"], justify="center", spacing3=PADDING)
+        self.text.tag_configure("info", justify="center", spacing3=PADDING)
+        self.text.tag_configure("header", font=fonts()["header"], justify="center", spacing1=PADDING, spacing3=5)
+        self.text.tag_configure("step", lmargin2=20, spacing1=5, spacing3=5)
+        self.text.tag_configure("loading", justify="center", spacing1=PADDING)
+        self.text.tag_configure("error", foreground=ERROR_COLOR, justify="center", spacing1=PADDING)
+
+        self.text.insert("end", f"{self.recipe_data['title']}\n", "title")
+        self.text.configure(state="disabled")
 
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw", width=550)
         scrollbar.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
+        self.text.pack(side="left", fill="both", expand=True)
+
+    def _insert(self, *chunks):
+        # The window may have been closed while a fetch was still in flight
+        if not self.winfo_exists():
+            return
+        self.text.configure(state="normal")
+        if self.text.tag_ranges("loading"):
+            self.text.delete("loading.first", "loading.last")
+        self.text.insert("end", *chunks)
+        self.text.configure(state="disabled")
 
     def _load_recipe_details(self):
-        try:
-            details = self.recipe_service.get_recipe_details(self.recipe_data["id"])
-            instructions = self.recipe_service.get_recipe_instructions(self.recipe_data["id"])
+        self._insert("Loading…\n", "loading")
+        threading.Thread(target=self._fetch_recipe_details, daemon=True).start()
 
-            # Display recipe information
-            info_frame = ttk.Frame(self.scrollable_frame)
-            info_frame.pack(fill="x", pady=PADDING)
+    def _fetch_recipe_details(self):
+        try:
+            recipe_id = self.recipe_data["id"]
+            # Fetching details also caches the instructions, so this is a single request
+            details = self.recipe_service.get_recipe_details(recipe_id)
+            instructions = self.recipe_service.get_recipe_instructions(recipe_id)
+        except Exception as e:
+            self.after(0, self._show_error, e)
+            return
+        self.after(0, self._show_recipe_details, details, instructions)
 
+    def _show_recipe_details(self, details, instructions):
+        chunks = []
+        try:
             # Time and servings
             time = details.get("readyInMinutes", "N/A")
             servings = details.get("servings", "N/A")
-            
-            ttk.Label(
-                info_frame,
-                text=f"🕒 {time} minutes",
-                font=NORMAL_FONT
-            ).pack(side="left", padx=5)
-            
-            ttk.Label(
-                info_frame,
-                text=f"👥 Serves {servings}",
-                font=NORMAL_FONT
-            ).pack(side="left", padx=5)
+            chunks += [f"🕒 {time} minutes     👥 Serves {servings}\n", "info"]
 
             # Ingredients
-            ttk.Label(
-                self.scrollable_frame,
-                text="Ingredients",
-                font=HEADER_FONT
-            ).pack(pady=(PADDING, 5))
-
+            chunks += ["Ingredients\n", "header"]
             for ingredient in details.get("extendedIngredients", []):
-                ttk.Label(
-                    self.scrollable_frame,
-                    text=f"• {ingredient.get('original')}",
-                    font=NORMAL_FONT,
-                    wraplength=500
-                ).pack(anchor="w")
+                chunks += [f"• {ingredient.get('original')}\n", ()]
 
             # Instructions
-            ttk.Label(
-                self.scrollable_frame,
-                text="Instructions",
-                font=HEADER_FONT
-            ).pack(pady=(PADDING, 5))
-
-            for idx, step in enumerate(instructions[0].get("steps", []), 1):
-                step_frame = ttk.Frame(self.scrollable_frame)
-                step_frame.pack(fill="x", pady=5)
-
-                ttk.Label(
-                    step_frame,
-                    text=f"{idx}.",
-                    font=NORMAL_FONT
-                ).pack(side="left", padx=(0, 5))
-
-                ttk.Label(
-                    step_frame,
-                    text=step.get("step", ""),
-                    font=NORMAL_FONT,
-                    wraplength=500
-                ).pack(side="left", fill="x")
+            chunks += ["Instructions\n", "header"]
+            steps = instructions[0].get("steps", []) if instructions else []
+            if not steps:
+                chunks += ["No instructions available.\n", ()]
+            for idx, step in enumerate(steps, 1):
+                chunks += [f"{idx}. {step.get('step', '')}\n", "step"]
 
         except Exception as e:
-            ttk.Label(
-                self.scrollable_frame,
-                text=f"Error loading recipe details: {str(e)}",
-                font=NORMAL_FONT,
-                foreground=ERROR_COLOR
-            ).pack(pady=PADDING)
-
-class RecipeCard(tk.Frame):
-    def __init__(self, master, recipe, recipe_service, favorites_service):
-        super().__init__(master, bg="white", relief=tk.RAISED, bd=1)
-        self.recipe = recipe
+            # Keep whatever was already built instead of replacing the page with the error
+            chunks += [f"Error loading recipe details: {str(e)}\n", "error"]
+
+        self._insert(*chunks)
+
+    def _show_error(self, error):
+        self._insert(f"Error loading recipe details: {str(error)}\n", "error")
+
+class RecipeCard(tk.Canvas):
+    def __init__(self, master, recipe_service, favorites_service):
+        super().__init__(
+            master,
+            bg="white",
+            height=CARD_HEIGHT,
+            relief=tk.RAISED,
+            bd=1,
+            highlightthickness=0
+        )
+        self.recipe_id = 0
+        self.recipe_title = ""
+        self.used_ingredients: Tuple[str, ...] = ()
+        self.missed_ingredients: Tuple[str, ...] = ()
         self.recipe_service = recipe_service
         self.favorites_service = favorites_service
         self._create_widgets()
 
+    @property
+    def recipe(self) -> Recipe:
+        return Recipe(self.recipe_id, self.recipe_title, self.used_ingredients, self.missed_ingredients)
+
     def _create_widgets(self):
-        # Title and favorite button
-        header_frame = tk.Frame(self, bg="white")
-        header_frame.pack(fill="x", padx=PADDING, pady=(PADDING, 5))
+        # Text is drawn as canvas items by update_recipe; only the two buttons are real widgets
+        self.create_text(0, PADDING, font=fonts()["star"], anchor="ne", tags="favstar")
+        self.tag_bind("favstar", "<Button-1>", self._toggle_favorite)
+        self.tag_bind("favstar", "<Enter>", lambda e: self.configure(cursor="hand2"))
+        self.tag_bind("favstar", "<Leave>", lambda e: self.configure(cursor=""))
+
+        self.details_button = ttk.Button(self, text="View Details", command=self._show_details)
+        self.online_button = ttk.Button(self, text="View Online", command=self._open_recipe)
+        self.details_window = self.create_window(
+            0, CARD_HEIGHT - PADDING,
+            window=self.details_button,
+            anchor="se"
+        )
+        self.online_window = self.create_window(
+            0, CARD_HEIGHT - PADDING,
+            window=self.online_button,
+            anchor="sw"
+        )
+        # Recipe text must end above the buttons, since cards have a fixed height
+        button_height = max(self.details_button.winfo_reqheight(), self.online_button.winfo_reqheight())
+        self._text_bottom = CARD_HEIGHT - PADDING - button_height - 5
+
+        self.bind("<Configure>", self._on_configure)
+
+    def update_recipe(self, recipe_id, title, used_ingredients, missed_ingredients):
+        self.recipe_id = recipe_id
+        self.recipe_title = title
+        self.used_ingredients = used_ingredients
+        self.missed_ingredients = missed_ingredients
+        self.delete("recipe")
+        self._draw_recipe()
+        self._update_favorite_star()
+
+    def _update_favorite_star(self):
+        if self.favorites_service.is_favorite(self.recipe_id):
+            self.itemconfigure("favstar", text="★", fill=PRIMARY_COLOR)
+        else:
+            self.itemconfigure("favstar", text="☆", fill=TEXT_COLOR)
+
+    def _draw_recipe(self):
+        title_item = self.create_text(
+            PADDING, PADDING,
+            text=self.recipe_title,
+            font=fonts()["header"],
+            fill=PRIMARY_COLOR,
+            width=300,
+            anchor="nw",
+            tags=("recipe", "title")
+        )
+        if not self._fit_text(title_item):
+            return
+        y = self.bbox(title_item)[3] + 5
 
-        tk.Label(
-            header_frame,
-            text=self.recipe.title,
-            font=HEADER_FONT,
-            bg="white",
-            fg=PRIMARY_COLOR,
-            wraplength=300
-        ).pack(side="left")
-
-        self.favorite_btn = tk.Button(
-            header_frame,
-            text="★" if self.favorites_service.is_favorite(self.recipe.id) else "☆",
-            command=self._toggle_favorite,
-            font=(FONT_FAMILY, 16),
-            bg="white",
-            fg=PRIMARY_COLOR if self.favorites_service.is_favorite(self.recipe.id) else TEXT_COLOR,
-            bd=0,
-            cursor="hand2"
+        sections = (
+            ("✓ Available:", SECONDARY_COLOR, self.used_ingredients),
+            ("✗ Missing:", ERROR_COLOR, self.missed_ingredients)
         )
-        self.favorite_btn.pack(side="right")
-
-        # Ingredients
-        ingredients_frame = tk.Frame(self, bg="white")
-        ingredients_frame.pack(fill="x", padx=PADDING)
-
-        if self.recipe.used_ingredients:
-            tk.Label(
-                ingredients_frame,
-                text="✓ Available:",
-                font=(FONT_FAMILY, 10, "bold"),
-                bg="white",
-                fg=SECONDARY_COLOR
-            ).pack(anchor="w")
-            
-            tk.Label(
-                ingredients_frame,
-                text=", ".join(self.recipe.used_ingredients),
-                font=SMALL_FONT,
-                bg="white",
-                wraplength=300
-            ).pack(anchor="w")
-
-        if self.recipe.missed_ingredients:
-            tk.Label(
-                ingredients_frame,
-                text="✗ Missing:",
-                font=(FONT_FAMILY, 10, "bold"),
-                bg="white",
-                fg=ERROR_COLOR
-            ).pack(anchor="w", pady=(5, 0))
-            
-            tk.Label(
-                ingredients_frame,
-                text=", ".join(self.recipe.missed_ingredients),
-                font=SMALL_FONT,
-                bg="white",
-                wraplength=300
-            ).pack(anchor="w")
-
-        # Buttons
-        buttons_frame = tk.Frame(self, bg="white")
-        buttons_frame.pack(pady=PADDING)
-
-        ttk.Button(
-            buttons_frame,
-            text="View Details",
-            command=self._show_details
-        ).pack(side="left", padx=5)
-
-        ttk.Button(
-            buttons_frame,
-            text="View Online",
-            command=self._open_recipe
-        ).pack(side="left", padx=5)
-
-    def _toggle_favorite(self):
-        recipe_id = self.recipe.id
+        for label, color, ingredients in sections:
+            if not ingredients:
+                continue
+            label_item = self.create_text(
+                PADDING, y,
+                text=label,
+                font=fonts()["small_bold"],
+                fill=color,
+                anchor="nw",
+                tags="recipe"
+            )
+            if self.bbox(label_item)[3] > self._text_bottom:
+                self.delete(label_item)
+                return
+            ingredients_item = self.create_text(
+                PADDING, self.bbox(label_item)[3],
+                text=", ".join(ingredients),
+                font=fonts()["small"],
+                fill=TEXT_COLOR,
+                width=300,
+                anchor="nw",
+                tags="recipe"
+            )
+            if not self._fit_text(ingredients_item):
+                return
+            y = self.bbox(ingredients_item)[3] + 5
+
+    def _fit_text(self, item):
+        # Ellipsize the item so it ends above the buttons; returns False if it was cut short
+        if self.bbox(item)[3] <= self._text_bottom:
+            return True
+
+        text = self.itemcget(item, "text")
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            self.itemconfigure(item, text=text[:middle].rstrip() + "…")
+            if self.bbox(item)[3] <= self._text_bottom:
+                low = middle
+            else:
+                high = middle - 1
+        if low:
+            self.itemconfigure(item, text=text[:low].rstrip() + "…")
+        else:
+            self.delete(item)
+        return False
+
+    def _on_configure(self, event):
+        center = event.width // 2
+        self.coords("favstar", event.width - PADDING, PADDING)
+        self.coords(self.details_window, center - 5, CARD_HEIGHT - PADDING)
+        self.coords(self.online_window, center + 5, CARD_HEIGHT - PADDING)
+
+    def _toggle_favorite(self, event=None):
+        recipe_id = self.recipe_id
         if self.favorites_service.is_favorite(recipe_id):
             self.favorites_service.remove_favorite(recipe_id)
-            self.favorite_btn.configure(text="☆", fg=TEXT_COLOR)
         else:
-            self.favorites_service.add_favorite(recipe_id, self.recipe.__dict__)
-            self.favorite_btn.configure(text="★", fg=PRIMARY_COLOR)
+            self.favorites_service.add_favorite(recipe_id, asdict(self.recipe))
+        self._update_favorite_star()
 
     def _show_details(self):
-        RecipeDetailWindow(self, self.recipe.__dict__, self.recipe_service)
+        RecipeDetailWindow(self, asdict(self.recipe), self.recipe_service)
 
     def _open_recipe(self):
-        import webbrowser
         webbrowser.open(self.recipe.spoonacular_url)
 
 class RecipeFinderApp:
@@ -327,8 +509,14 @@ class RecipeFinderApp:
         self.root.geometry(WINDOW_SIZE)
         self.root.configure(bg=BACKGROUND_COLOR)
         
-        self.recipe_service = RecipeService()
-        self.favorites_service = FavoritesService()
+        try:
+            self.recipe_service = RecipeService()
+        except RuntimeError as e:
+            messagebox.showerror("Error", str(e))
+            self.root.destroy()
+            raise SystemExit(1)
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        self.favorites_service = FavoritesService(self.root)
         
         self._create_widgets()
 
@@ -337,7 +525,7 @@ class RecipeFinderApp:
         tk.Label(
             self.root,
             text="Recipe Finder",
-            font=TITLE_FONT,
+            font=fonts()["title"],
             bg=BACKGROUND_COLOR,
             fg=TEXT_COLOR
         ).pack(pady=PADDING)
@@ -349,13 +537,13 @@ class RecipeFinderApp:
         tk.Label(
             search_frame,
             text="Enter Ingredients:",
-            font=HEADER_FONT,
+            font=fonts()["header"],
             bg=BACKGROUND_COLOR,
             fg=TEXT_COLOR
         ).pack(anchor="w")
 
         # Search entry
-        self.search_entry = ttk.Entry(search_frame, font=NORMAL_FONT, width=50)
+        self.search_entry = ttk.Entry(search_frame, font=fonts()["normal"], width=50)
         self.search_entry.pack(pady=(5, 0), ipady=8)
         self.search_entry.insert(0, "e.g., chicken, rice, tomatoes")
         self.search_entry.bind("<FocusIn>", self._clear_placeholder)
@@ -363,31 +551,134 @@ class RecipeFinderApp:
         self.search_entry.bind("<Return>", lambda e: self._find_recipes())
 
         # Search button
-        ttk.Button(
+        self.search_button = ttk.Button(
             search_frame,
             text="Find Recipes",
             command=self._find_recipes
-        ).pack(pady=PADDING)
+        )
+        self.search_button.pack(pady=PADDING)
 
         # Results container
         self.results_frame = ttk.Frame(self.root)
         self.results_frame.pack(fill=tk.BOTH, expand=True, padx=PADDING, pady=PADDING)
 
-        # Scrollable canvas for results
-        self.canvas = tk.Canvas(self.results_frame, bg=BACKGROUND_COLOR)
-        scrollbar = ttk.Scrollbar(self.results_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
+        # Scrollable canvas for results; only cards near the viewport are materialized
+        self.canvas = tk.Canvas(self.results_frame, bg=BACKGROUND_COLOR, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self.results_frame, orient="vertical", command=self.canvas.yview)
+
+        # Result rows are kept as parallel arrays that visible cards read from by index
+        self._ids: List[int] = []
+        self._titles: List[str] = []
+        self._used: List[Tuple[str, ...]] = []
+        self._missed: List[Tuple[str, ...]] = []
+        self._content_width = 0
+        self._content_height = 0
+        self._cards: Dict[int, RecipeCard] = {}
+        self._card_items: Dict[int, int] = {}
+        self._card_pool: List[RecipeCard] = []
+        self._scrolling = False
+        self._scroll_idle_job = None
+
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
+        # Cards share a bind tag with the canvas so the wheel scrolls from anywhere in the list
+        self.canvas.bindtags((RESULTS_SCROLL_TAG,) + self.canvas.bindtags())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_class(RESULTS_SCROLL_TAG, sequence, self._on_mousewheel)
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
 
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+    def _on_canvas_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._update_visible_cards()
 
-        self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+    def _on_mousewheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-1, "units")
+        else:
+            self.canvas.yview_scroll(1, "units")
+
+        self._scrolling = True
+        if self._scroll_idle_job is not None:
+            self.root.after_cancel(self._scroll_idle_job)
+        self._scroll_idle_job = self.root.after(SCROLL_IDLE_MS, self._on_scroll_idle)
+
+    def _on_scroll_idle(self):
+        self._scroll_idle_job = None
+        self._scrolling = False
+        self._update_visible_cards()
+
+    def _on_canvas_configure(self, event):
+        self._content_width = event.width
+        for item in self._card_items.values():
+            self.canvas.itemconfigure(item, width=event.width)
+        self._update_scrollregion()
+        self._update_visible_cards()
+
+    def _update_scrollregion(self):
+        # Content bounds are tracked as rows are added, so no bbox("all") scan is needed
+        self.canvas.configure(scrollregion=(0, 0, self._content_width, self._content_height))
+
+    def _update_visible_cards(self):
+        if not self._ids:
+            return
+
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first = max(int(top // ROW_HEIGHT) - VISIBLE_ROW_MARGIN, 0)
+        last = min(int(bottom // ROW_HEIGHT) + VISIBLE_ROW_MARGIN, len(self._ids) - 1)
+
+        # Recycling off-screen cards can wait until the wheel goes idle
+        if not self._scrolling:
+            for row in [row for row in self._cards if not first <= row <= last]:
+                self._release_card(row)
+
+        for row in range(first, last + 1):
+            if row in self._cards:
+                continue
+            card = self._acquire_card(row)
+            self._cards[row] = card
+            self._card_items[row] = self.canvas.create_window(
+                (0, row * ROW_HEIGHT),
+                window=card,
+                anchor="nw",
+                width=self._content_width,
+                height=CARD_HEIGHT
+            )
+
+    def _add_result(self, recipe):
+        self._ids.append(recipe.id)
+        self._titles.append(recipe.title)
+        self._used.append(recipe.used_ingredients)
+        self._missed.append(recipe.missed_ingredients)
+
+    def _acquire_card(self, row):
+        if self._card_pool:
+            card = self._card_pool.pop()
+        else:
+            card = RecipeCard(self.canvas, self.recipe_service, self.favorites_service)
+            for widget in (card, card.details_button, card.online_button):
+                widget.bindtags((RESULTS_SCROLL_TAG,) + widget.bindtags())
+        card.update_recipe(self._ids[row], self._titles[row], self._used[row], self._missed[row])
+        return card
+
+    def _release_card(self, row):
+        # Deleting the window item unmaps the card; keep the widget for reuse
+        self.canvas.delete(self._card_items.pop(row))
+        self._card_pool.append(self._cards.pop(row))
+
+    def _clear_results(self):
+        for row in list(self._cards):
+            self._release_card(row)
+        self._ids.clear()
+        self._titles.clear()
+        self._used.clear()
+        self._missed.clear()
+        self._content_height = 0
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
 
     def _clear_placeholder(self, event):
         if self.search_entry.get() == "e.g., chicken, rice, tomatoes":
@@ -398,37 +689,58 @@ class RecipeFinderApp:
             self.search_entry.insert(0, "e.g., chicken, rice, tomatoes")
 
     def _find_recipes(self):
+        if self.search_button.instate(["disabled"]):
+            return
+
         # Clear previous results
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self._clear_results()
 
         ingredients = self.search_entry.get().strip()
-        if not ingredients or ingredients == "e.g., chicken, rice, tomatoes":
+        if ingredients == "e.g., chicken, rice, tomatoes":
+            ingredients = ""
+        ingredients = normalize_ingredients(ingredients)
+        if not ingredients:
             messagebox.showerror("Error", "Please enter some ingredients!")
             return
 
-        try:
-            recipes_data = self.recipe_service.find_recipes_by_ingredients(ingredients)
-            recipes = [Recipe.from_api_response(data) for data in recipes_data]
-
-            if not recipes:
-                messagebox.showinfo("Info", "No recipes found.")
-                return
-
-            for recipe in recipes:
-                card = RecipeCard(
-                    self.scrollable_frame,
-                    recipe,
-                    self.recipe_service,
-                    self.favorites_service
-                )
-                card.pack(fill=tk.X, pady=(0, PADDING))
+        self.search_button.state(["disabled"])
+        threading.Thread(target=self._fetch_recipes, args=(ingredients,), daemon=True).start()
 
+    def _fetch_recipes(self, ingredients):
+        count = 0
+        try:
+            for data in self.recipe_service.find_recipes_by_ingredients(ingredients):
+                self.root.after(0, self._add_card, Recipe.from_api_response(data))
+                count += 1
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to fetch recipes: {str(e)}")
+            self.root.after(0, self._show_fetch_error, e)
+            return
+        self.root.after(0, self._finish_results, count)
+
+    def _show_fetch_error(self, error):
+        self.search_button.state(["!disabled"])
+        messagebox.showerror("Error", f"Failed to fetch recipes: {str(error)}")
+
+    def _add_card(self, recipe):
+        self._add_result(recipe)
+        self._content_height += ROW_HEIGHT
+        self._update_scrollregion()
+        self._update_visible_cards()
+
+    def _finish_results(self, count):
+        self.search_button.state(["!disabled"])
+        if not count:
+            messagebox.showinfo("Info", "No recipes found.")
+            return
+        # Warm the details cache so opening any result doesn't wait on the network
+        self._prefetch_executor.submit(self.recipe_service.get_recipe_details_bulk, list(self._ids))
 
     def run(self):
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._prefetch_executor.shutdown(wait=False)
+            self.recipe_service.close()
 
 if __name__ == "__main__":
     app = RecipeFinderApp()